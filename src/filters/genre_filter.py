@@ -1,13 +1,31 @@
 """Genre filtering for scraped releases."""
 
 import logging
-from typing import List
+import re
+import sys
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Pattern, Tuple
 
 from ..config import EXCLUDE_GENRES, INCLUDE_GENRES
 from ..models import ScrapedRelease
 
 logger = logging.getLogger(__name__)
 
+# Separator for the joined term haystacks; never appears in a genre tag, so a
+# tag can only match within a single configured term.
+_TERM_SEP = "\x00"
+
+
+@lru_cache(maxsize=None)
+def _compile_terms(terms: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile terms into one alternation regex, shared across filters."""
+    # An empty alternation would match every string; no terms means no match
+    if not terms:
+        return None
+    # Longer, more specific terms first so a hit is found earlier
+    ordered = sorted(terms, key=len, reverse=True)
+    return re.compile("|".join(re.escape(t) for t in ordered))
+
 
 class GenreFilter:
     """Filter releases based on genre preferences."""
@@ -17,21 +35,47 @@ class GenreFilter:
         include_genres: List[str] = None,
         exclude_genres: List[str] = None,
     ):
-        self.include = [g.lower() for g in (include_genres or INCLUDE_GENRES)]
-        self.exclude = [g.lower() for g in (exclude_genres or EXCLUDE_GENRES)]
+        self.include = [
+            sys.intern(g.lower()) for g in (include_genres or INCLUDE_GENRES)
+        ]
+        self.exclude = [
+            sys.intern(g.lower()) for g in (exclude_genres or EXCLUDE_GENRES)
+        ]
+
+        # Substring matching runs in both directions, so precompile each side
+        # once: an alternation regex finds any configured term inside a tag,
+        # and a joined haystack finds the tag inside any configured term.
+        self._inc_re = _compile_terms(tuple(self.include))
+        self._exc_re = _compile_terms(tuple(self.exclude))
+        self._inc_haystack = _TERM_SEP.join(self.include)
+        self._exc_haystack = _TERM_SEP.join(self.exclude)
+
+        # Most tags are canonical tokens that equal a configured term, so
+        # exact set lookups settle them before any substring scan. Include
+        # terms that don't overlap an exclude term are known to be safe.
+        self._inc_set = frozenset(self.include)
+        self._exc_set = frozenset(self.exclude)
+        self._safe_set = frozenset(
+            g for g in self.include if not self._matches_exclude(g)
+        )
 
-    def filter(self, releases: List[ScrapedRelease]) -> List[ScrapedRelease]:
+    def filter(self, releases: Iterable[ScrapedRelease]) -> List[ScrapedRelease]:
         """Filter releases by genre preferences."""
-        filtered = []
+        return list(self.iter_filter(releases))
+
+    def iter_filter(
+        self, releases: Iterable[ScrapedRelease]
+    ) -> Iterator[ScrapedRelease]:
+        """Lazily yield releases matching genre preferences."""
         for release in releases:
             if self._should_include(release):
-                filtered.append(release)
+                yield release
             else:
+                # Lazy %-formatting: no string is built unless DEBUG is on
                 logger.debug(
-                    f"Filtered out: {release.artist} - {release.title} "
-                    f"(genres: {release.genres})"
+                    "Filtered out: %s - %s (genres: %s)",
+                    release.artist, release.title, release.genres,
                 )
-        return filtered
 
     def _should_include(self, release: ScrapedRelease) -> bool:
         """
@@ -42,28 +86,36 @@ class GenreFilter:
         2. If any genre matches include list -> accept
         3. If no genres specified -> accept (be permissive for discovery)
         """
-        release_genres = [g.lower() for g in release.genres]
-
-        # Check exclusions first (these are hard rejections)
-        for genre in release_genres:
-            for excluded in self.exclude:
-                # Check for substring match in either direction
-                if excluded in genre or genre in excluded:
-                    logger.debug(
-                        f"Excluded '{release.artist} - {release.title}' "
-                        f"due to genre '{genre}' matching exclude '{excluded}'"
-                    )
-                    return False
+        # Genres are lowercased at ingest: by ScrapedRelease.__post_init__,
+        # and by _normalize_genres for genres the scrapers attach later
+        release_genres = release.genres
 
         # If no genres tagged, be permissive (trust the source's curation)
         if not release_genres:
             return True
 
+        # Check exclusions first (these are hard rejections)
+        excluded = next(
+            (
+                genre
+                for genre in release_genres
+                if genre not in self._safe_set
+                and (genre in self._exc_set or self._matches_exclude(genre))
+            ),
+            None,
+        )
+        if excluded is not None:
+            logger.debug(
+                "Excluded '%s - %s' due to genre '%s' matching exclude list",
+                release.artist, release.title, excluded,
+            )
+            return False
+
         # Check inclusions
-        for genre in release_genres:
-            for included in self.include:
-                if included in genre or genre in included:
-                    return True
+        if not self._inc_set.isdisjoint(release_genres):
+            return True
+        if any(self._matches_include(genre) for genre in release_genres):
+            return True
 
         # No match found - if we have genres but none match our includes,
         # we might be missing something. Be permissive.
@@ -74,3 +126,15 @@ class GenreFilter:
 
         # Few or no genre tags - accept to avoid missing good music
         return True
+
+    def _matches_exclude(self, genre: str) -> bool:
+        """Check for an exclude substring match in either direction."""
+        if self._exc_re is None:
+            return False
+        return bool(self._exc_re.search(genre)) or genre in self._exc_haystack
+
+    def _matches_include(self, genre: str) -> bool:
+        """Check for an include substring match in either direction."""
+        if self._inc_re is None:
+            return False
+        return bool(self._inc_re.search(genre)) or genre in self._inc_haystack
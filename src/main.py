@@ -2,14 +2,19 @@
 
 import logging
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
 
 from .config import TARGET_PLAYLIST_SIZE
 from .filters import Deduplicator, GenreFilter
 from .matching import SpotifyMatcher
+from .models import PlaylistItem, ScrapedRelease
 from .output import OutputGenerator
 from .scrapers import (
     BandcampDailyScraper,
+    BaseScraper,
     BrooklynVeganScraper,
     PitchforkAlbumsScraper,
     PitchforkSundayScraper,
@@ -28,6 +33,41 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _scrape_sequentially(
+    scrapers: List[BaseScraper],
+) -> Dict[str, List[ScrapedRelease]]:
+    """Run scrapers one after another, returning releases by source name."""
+    results = {}
+    for scraper in scrapers:
+        try:
+            logger.info(f"Scraping {scraper.SOURCE_NAME}...")
+            releases = scraper.scrape()
+            logger.info(f"  {scraper.SOURCE_NAME}: found {len(releases)} releases")
+        except Exception as e:
+            logger.error(f"Failed to scrape {scraper.SOURCE_NAME}: {e}")
+            releases = []
+        results[scraper.SOURCE_NAME] = releases
+    return results
+
+
+def _match_releases(
+    releases: Iterable[ScrapedRelease],
+    spotify_matcher: SpotifyMatcher,
+    counts: Counter,
+) -> Iterator[PlaylistItem]:
+    """Yield playlist items for releases, tallying match results in counts."""
+    for release in releases:
+        counts["releases"] += 1
+        items = spotify_matcher.match_release(release)
+        # Check if we got real matches or search placeholders
+        if any(i.spotify_uri.startswith("spotify:track:") for i in items):
+            counts["matched"] += 1
+        else:
+            counts["failed"] += 1
+        counts["items"] += len(items)
+        yield from items
+
+
 def main():
     """Main orchestration function."""
     logger.info("=" * 60)
@@ -45,13 +85,15 @@ def main():
     deduplicator = Deduplicator()
     output_generator = OutputGenerator(data_path / "output")
 
-    # Initialize scrapers
+    # Initialize scrapers with one shared session, so the Pitchfork
+    # scrapers reuse the same pooled connections and parsed pages
+    session = BaseScraper.create_session()
     scrapers = [
-        BandcampDailyScraper(),
-        PitchforkAlbumsScraper(),
-        PitchforkTracksScraper(),
-        PitchforkSundayScraper(),
-        BrooklynVeganScraper(),
+        BandcampDailyScraper(session=session),
+        PitchforkAlbumsScraper(session=session),
+        PitchforkTracksScraper(session=session),
+        PitchforkSundayScraper(session=session),
+        BrooklynVeganScraper(session=session),
     ]
 
     # ========================================
@@ -64,16 +106,26 @@ def main():
     all_releases = []
     scraper_results = {}
 
+    # Scrapers sharing a rate-limit key hit the same site, so each key's
+    # scrapers run in order on one worker while different sites overlap
+    scraper_groups = defaultdict(list)
     for scraper in scrapers:
-        try:
-            logger.info(f"Scraping {scraper.SOURCE_NAME}...")
-            releases = scraper.scrape()
-            scraper_results[scraper.SOURCE_NAME] = len(releases)
-            logger.info(f"  Found {len(releases)} releases")
-            all_releases.extend(releases)
-        except Exception as e:
-            logger.error(f"Failed to scrape {scraper.SOURCE_NAME}: {e}")
-            scraper_results[scraper.SOURCE_NAME] = 0
+        scraper_groups[scraper.RATE_LIMIT_KEY].append(scraper)
+
+    scraped = {}
+    with ThreadPoolExecutor(max_workers=len(scraper_groups)) as executor:
+        futures = [
+            executor.submit(_scrape_sequentially, group)
+            for group in scraper_groups.values()
+        ]
+        for future in futures:
+            scraped.update(future.result())
+
+    # Collect in scraper order so the playlist doesn't depend on timing
+    for scraper in scrapers:
+        releases = scraped[scraper.SOURCE_NAME]
+        scraper_results[scraper.SOURCE_NAME] = len(releases)
+        all_releases.extend(releases)
 
     logger.info(f"Total releases scraped: {len(all_releases)}")
 
@@ -88,59 +140,36 @@ def main():
         return None
 
     # ========================================
-    # Phase 2: Filter by genre
+    # Phase 2: Filter, match and deduplicate
     # ========================================
     logger.info("")
-    logger.info("Phase 2: Filtering by genre preferences...")
+    logger.info("Phase 2: Filtering, matching to Spotify and deduplicating...")
     logger.info("-" * 40)
 
-    filtered_releases = genre_filter.filter(all_releases)
-    logger.info(f"After genre filter: {len(filtered_releases)} releases")
-
-    if not filtered_releases:
+    # Releases stream through filter -> matcher -> deduplicator, so only
+    # the deduplicated items are ever held in memory
+    counts = Counter()
+    priority_items, unique_items = deduplicator.deduplicate(
+        _match_releases(
+            genre_filter.iter_filter(all_releases), spotify_matcher, counts
+        )
+    )
+    logger.info(f"After genre filter: {counts['releases']} releases")
+
+    if not counts["releases"]:
         logger.warning("No releases passed genre filter. Using all releases.")
-        filtered_releases = all_releases
+        priority_items, unique_items = deduplicator.deduplicate(
+            _match_releases(all_releases, spotify_matcher, counts)
+        )
 
-    # ========================================
-    # Phase 3: Match to Spotify
-    # ========================================
-    logger.info("")
-    logger.info("Phase 3: Matching to Spotify...")
-    logger.info("-" * 40)
-
-    all_items = []
-    matched_count = 0
-    failed_count = 0
-
-    for release in filtered_releases:
-        items = spotify_matcher.match_release(release)
-        if items:
-            # Check if we got real matches or search placeholders
-            real_matches = [i for i in items if i.spotify_uri.startswith("spotify:track:")]
-            if real_matches:
-                matched_count += 1
-            else:
-                failed_count += 1
-            all_items.extend(items)
-        else:
-            failed_count += 1
-
-    logger.info(f"Matched {matched_count} releases to Spotify")
-    logger.info(f"Failed to match {failed_count} releases (will need manual search)")
-    logger.info(f"Total playlist items: {len(all_items)}")
+    logger.info(f"Matched {counts['matched']} releases to Spotify")
+    logger.info(f"Failed to match {counts['failed']} releases (will need manual search)")
+    logger.info(f"Total playlist items: {counts['items']}")
 
-    if not all_items:
+    if not counts["items"]:
         logger.error("No items matched to Spotify. Exiting.")
         return None
 
-    # ========================================
-    # Phase 4: Deduplicate and prioritize
-    # ========================================
-    logger.info("")
-    logger.info("Phase 4: Deduplicating and prioritizing...")
-    logger.info("-" * 40)
-
-    priority_items, unique_items = deduplicator.deduplicate(all_items)
     logger.info(f"Priority tracks (multi-source): {len(priority_items)}")
     logger.info(f"Unique tracks: {len(unique_items)}")
 
@@ -148,26 +177,31 @@ def main():
     grouped_items = deduplicator.group_by_album(unique_items)
 
     # ========================================
-    # Phase 5: Apply retention policy
+    # Phase 3: Apply retention policy
     # ========================================
     logger.info("")
-    logger.info("Phase 5: Applying retention policy...")
+    logger.info("Phase 3: Applying retention policy...")
     logger.info("-" * 40)
 
     current_items = state_manager.apply_retention(grouped_items)
 
     # ========================================
-    # Phase 6: Trim to target size
+    # Phase 4: Trim to target size
     # ========================================
     logger.info("")
-    logger.info("Phase 6: Finalizing playlist...")
+    logger.info("Phase 4: Finalizing playlist...")
     logger.info("-" * 40)
 
     if len(current_items) > TARGET_PLAYLIST_SIZE:
         # Keep priority items, fill rest up to target
         priority_uris = {item.spotify_uri for item in priority_items}
-        priority_in_current = [i for i in current_items if i.spotify_uri in priority_uris]
-        others = [i for i in current_items if i.spotify_uri not in priority_uris]
+        priority_in_current = []
+        others = []
+        for item in current_items:
+            if item.spotify_uri in priority_uris:
+                priority_in_current.append(item)
+            else:
+                others.append(item)
 
         slots_for_others = TARGET_PLAYLIST_SIZE - len(priority_in_current)
         if slots_for_others > 0:
@@ -187,10 +221,10 @@ def main():
     final_priority = [p for p in priority_items if p.spotify_uri in final_uris]
 
     # ========================================
-    # Phase 7: Generate output
+    # Phase 5: Generate output
     # ========================================
     logger.info("")
-    logger.info("Phase 7: Generating output...")
+    logger.info("Phase 5: Generating output...")
     logger.info("-" * 40)
 
     output_file = output_generator.generate(final_items, final_priority)
@@ -1,10 +1,10 @@
 """Data model for playlist items."""
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistItem:
     """Represents a track in the playlist with Spotify info."""
 
@@ -16,10 +16,13 @@ class PlaylistItem:
     scraped_date: str
     sources: List[str] = field(default_factory=list)
     weeks_in_playlist: int = 0
+    # Lowercased (artist, album), computed once for album grouping
+    album_key: Tuple[str, str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.sources:
             self.sources = [self.source]
+        self.album_key = (self.artist.lower(), self.album.lower())
 
     def __hash__(self):
         return hash(self.spotify_uri)
@@ -31,13 +34,4 @@ class PlaylistItem:
 
     def copy(self) -> "PlaylistItem":
         """Create a copy of this item."""
-        return PlaylistItem(
-            artist=self.artist,
-            track=self.track,
-            album=self.album,
-            spotify_uri=self.spotify_uri,
-            source=self.source,
-            scraped_date=self.scraped_date,
-            sources=self.sources.copy(),
-            weeks_in_playlist=self.weeks_in_playlist,
-        )
+        return replace(self, sources=self.sources.copy())
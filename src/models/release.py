@@ -1,10 +1,11 @@
 """Data model for scraped releases."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedRelease:
     """Represents a music release scraped from a source."""
 
@@ -16,14 +17,19 @@ class ScrapedRelease:
     scraped_date: str
     genres: List[str] = field(default_factory=list)
     location: Optional[str] = None
+    # Lowercased (artist, title), computed once for hashing and comparison
+    key: Tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Normalize once here so genre matching never re-lowercases; the
+        # same few genre names recur across releases, so share one copy
+        self.genres = [sys.intern(g.lower()) for g in self.genres]
+        self.key = (self.artist.lower(), self.title.lower())
 
     def __hash__(self):
-        return hash((self.artist.lower(), self.title.lower()))
+        return hash(self.key)
 
     def __eq__(self, other):
         if not isinstance(other, ScrapedRelease):
             return False
-        return (
-            self.artist.lower() == other.artist.lower()
-            and self.title.lower() == other.title.lower()
-        )
+        return self.key == other.key
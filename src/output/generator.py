@@ -26,36 +26,39 @@ class OutputGenerator:
           date_str = datetime.now().strftime("%Y-%m-%d")
           output_file = self.output_dir / f"playlist_{date_str}.txt"
 
-          lines = []
-          lines.append(f"Weekly Playlist - {date_str}")
-          lines.append(f"Total items: {len(items)}")
-          lines.append("=" * 70)
-          lines.append("")
+          # Each block ends in a newline and blocks are separated by a blank
+          # line, so the file ends with a single newline
+          blocks = [
+              f"Weekly Playlist - {date_str}\n"
+              f"Total items: {len(items)}\n"
+              f"{'=' * 70}\n"
+          ]
+          append = blocks.append
 
           if priority_items:
-              lines.append("### PRIORITY - Multiple Sources ###")
-              lines.append("")
+              append("### PRIORITY - Multiple Sources ###\n")
               for item in priority_items:
                   sources = ", ".join(item.sources)
-                  lines.append(f"* {item.artist} - {item.track}")
-                  lines.append(f"  Sources: {sources}")
-                  lines.append(f"  Search: {item.spotify_uri}")
-                  lines.append("")
+                  append(
+                      f"* {item.artist} - {item.track}\n"
+                      f"  Sources: {sources}\n"
+                      f"  Search: {item.spotify_uri}\n"
+                  )
 
-          lines.append("### FULL PLAYLIST ###")
-          lines.append("")
+          append("### FULL PLAYLIST ###\n")
 
           for i, item in enumerate(items, 1):
-              if "[Album:" in item.track:
-                  lines.append(f"{i}. {item.artist} - {item.album}")
-              else:
-                  lines.append(f"{i}. {item.artist} - {item.track}")
-              source = item.sources[0] if item.sources else item.source
-              lines.append(f"   Source: {source}")
-              lines.append(f"   Search: {item.spotify_uri}")
-              lines.append("")
-
-          content = "\n".join(lines)
-          output_file.write_text(content, encoding="utf-8")
+              track = item.track
+              title = item.album if "[Album:" in track else track
+              sources = item.sources
+              source = sources[0] if sources else item.source
+              append(
+                  f"{i}. {item.artist} - {title}\n"
+                  f"   Source: {source}\n"
+                  f"   Search: {item.spotify_uri}\n"
+              )
+
+          data = "\n".join(blocks).encode("utf-8")
+          output_file.write_bytes(data)
           logger.info(f"Output written to: {output_file}")
           return output_file
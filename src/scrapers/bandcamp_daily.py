@@ -1,14 +1,18 @@
 """Scraper for Bandcamp Daily."""
 
 import re
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from bs4 import BeautifulSoup
 
 from ..models import ScrapedRelease
 from .base import BaseScraper
 
+_BANDCAMP_ALBUM_RE = re.compile(r"https?://([^.]+)\.bandcamp\.com/album/([^/?]+)")
+# "/best-of" has no trailing slash so yearly pages like /best-of-2025 match
+_ARTICLE_URL_RE = re.compile(r"/(?:album-of-the-day/|features/|best-of|lists/)")
+_GENRE_SELECTOR = "a[href*='/genres/'], .tag, .genre, meta[name='keywords']"
+
 
 class BandcampDailyScraper(BaseScraper):
     """Scraper for Bandcamp Daily - Album of the Day and Essential Releases."""
@@ -24,89 +28,106 @@ class BandcampDailyScraper(BaseScraper):
         "/lists",
     ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Articles already queued this run, shared by the main page and
+        # every section so an article linked from several is fetched once
+        self._seen_article_urls: Set[str] = set()
+
     def scrape(self) -> List[ScrapedRelease]:
         """Scrape releases from Bandcamp Daily."""
-        releases = []
+        self._seen_article_urls.clear()
+
+        # Keyed by release key so duplicates are dropped as they are found;
+        # the first occurrence wins and keeps its position
+        releases: Dict[Tuple[str, str], ScrapedRelease] = {}
 
         # Scrape main page for recent articles
         main_soup = self._fetch_page(self.BASE_URL)
         if main_soup:
-            releases.extend(self._parse_main_page(main_soup))
+            self._parse_main_page(main_soup, releases)
 
         # Scrape specific sections
         for section in self.SECTIONS:
             url = f"{self.BASE_URL}{section}"
             soup = self._fetch_page(url)
             if soup:
-                releases.extend(self._parse_section_page(soup, section))
+                self._parse_section_page(soup, section, releases)
 
-        self._validate_results(releases)
-        return self._dedupe_releases(releases)
+        results = list(releases.values())
+        self._validate_results(results)
+        return results
 
-    def _parse_main_page(self, soup: BeautifulSoup) -> List[ScrapedRelease]:
+    def _parse_main_page(
+        self, soup: BeautifulSoup, releases: Dict[Tuple[str, str], ScrapedRelease]
+    ):
         """Parse the main Bandcamp Daily page."""
-        releases = []
-
         # Find article links
         article_links = soup.select("a[href*='/album-of-the-day/'], a[href*='/features/']")
 
-        seen_urls = set()
+        article_urls = []
         for link in article_links[:10]:  # Limit to recent articles
             href = link.get("href", "")
-            if not href or href in seen_urls:
+            if not href:
                 continue
-            seen_urls.add(href)
 
             article_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-            article_releases = self._parse_article(article_url)
-            releases.extend(article_releases)
+            if article_url in self._seen_article_urls:
+                continue
+            self._seen_article_urls.add(article_url)
+            article_urls.append(article_url)
 
-        return releases
+        self._parse_articles(article_urls, releases)
 
     def _parse_section_page(
-        self, soup: BeautifulSoup, section: str
-    ) -> List[ScrapedRelease]:
+        self,
+        soup: BeautifulSoup,
+        section: str,
+        releases: Dict[Tuple[str, str], ScrapedRelease],
+    ):
         """Parse a section listing page."""
-        releases = []
-
         # Find article links in the section
         article_links = soup.select("article a[href], .list-article a[href]")
 
-        seen_urls = set()
+        article_urls = []
         for link in article_links[:8]:  # Limit per section
             href = link.get("href", "")
-            if not href or href in seen_urls or "#" in href:
+            if not href or "#" in href:
                 continue
-            seen_urls.add(href)
 
             article_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
+            if article_url in self._seen_article_urls:
+                continue
 
             # Only process album/music articles
-            if any(
-                x in article_url
-                for x in ["/album-of-the-day/", "/features/", "/best-of", "/lists/"]
-            ):
-                article_releases = self._parse_article(article_url)
-                releases.extend(article_releases)
+            if _ARTICLE_URL_RE.search(article_url):
+                self._seen_article_urls.add(article_url)
+                article_urls.append(article_url)
 
-        return releases
+        self._parse_articles(article_urls, releases)
 
-    def _parse_article(self, url: str) -> List[ScrapedRelease]:
-        """Parse an individual Bandcamp Daily article for album/artist info."""
-        releases = []
-        soup = self._fetch_page(url)
-        if not soup:
-            return releases
+    def _parse_articles(
+        self, urls: List[str], releases: Dict[Tuple[str, str], ScrapedRelease]
+    ):
+        """Fetch articles concurrently and parse them in their listed order."""
+        for url, soup in self._fetch_many(urls):
+            if soup:
+                self._parse_article(soup, releases)
 
+    def _parse_article(
+        self, soup: BeautifulSoup, releases: Dict[Tuple[str, str], ScrapedRelease]
+    ):
+        """Parse an individual Bandcamp Daily article for album/artist info."""
         # Look for Bandcamp embeds/links which contain artist and album info
         bandcamp_links = soup.select("a[href*='bandcamp.com']")
 
+        # Article genres are the same for every album it links, so they
+        # are extracted once, on the first album link
+        genres = None
         for link in bandcamp_links:
             href = link.get("href", "")
             # Match album pages: artist.bandcamp.com/album/album-name
-            album_match = re.search(
-                r"https?://([^.]+)\.bandcamp\.com/album/([^/?]+)", href
-            )
+            album_match = _BANDCAMP_ALBUM_RE.search(href)
             if album_match:
                 artist_slug = album_match.group(1)
                 album_slug = album_match.group(2)
@@ -117,7 +138,8 @@ class BandcampDailyScraper(BaseScraper):
                 )
 
                 # Extract genres from article content
-                genres = self._extract_genres_from_article(soup)
+                if genres is None:
+                    genres = self._extract_genres_from_article(soup)
 
                 release = ScrapedRelease(
                     artist=artist,
@@ -125,12 +147,10 @@ class BandcampDailyScraper(BaseScraper):
                     source=self.SOURCE_NAME,
                     release_type="album",
                     url=href,
-                    scraped_date=datetime.now().isoformat(),
+                    scraped_date=self._scraped_date,
                     genres=genres,
                 )
-                releases.append(release)
-
-        return releases
+                releases.setdefault(release.key, release)
 
     def _extract_names_from_context(
         self, link, artist_slug: str, album_slug: str
@@ -159,29 +179,20 @@ class BandcampDailyScraper(BaseScraper):
     def _extract_genres_from_article(self, soup: BeautifulSoup) -> List[str]:
         """Extract genre tags from article content."""
         genres = []
+        keywords = None
 
-        # Look for genre tags/links
-        genre_links = soup.select("a[href*='/genres/'], .tag, .genre")
-        for link in genre_links:
-            genre = link.get_text(strip=True).lower()
+        # Genre tags/links and the keywords meta tag in one traversal
+        for elem in soup.select(_GENRE_SELECTOR):
+            if elem.name == "meta":
+                if keywords is None:
+                    keywords = elem.get("content", "")
+                continue
+            genre = elem.get_text(strip=True).lower()
             if genre and len(genre) < 30:
                 genres.append(genre)
 
         # Also check meta tags
-        meta_keywords = soup.select_one("meta[name='keywords']")
-        if meta_keywords:
-            keywords = meta_keywords.get("content", "")
+        if keywords:
             genres.extend([k.strip().lower() for k in keywords.split(",") if k.strip()])
 
         return self._normalize_genres(genres)
-
-    def _dedupe_releases(self, releases: List[ScrapedRelease]) -> List[ScrapedRelease]:
-        """Remove duplicate releases."""
-        seen = set()
-        unique = []
-        for release in releases:
-            key = (release.artist.lower(), release.title.lower())
-            if key not in seen:
-                seen.add(key)
-                unique.append(release)
-        return unique
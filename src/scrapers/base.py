@@ -2,12 +2,17 @@
 
 import logging
 import random
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
 
 from ..config import RATE_LIMITS
 from ..models import ScrapedRelease
@@ -22,15 +27,43 @@ class BaseScraper(ABC):
       BASE_URL: str = ""
       RATE_LIMIT_KEY: str = "default"
 
-      def __init__(self):
-          self.session = requests.Session()
-          self.session.headers.update({
+      # Rate-limit state is shared by every scraper with the same key, so
+      # scrapers hitting one site space out their requests together
+      _last_request_times: Dict[str, float] = {}
+      _rate_locks: Dict[str, threading.Lock] = {}
+      _rate_locks_guard = threading.Lock()
+
+      # Parsed pages are shared by scrapers on the same session, so a URL
+      # several of them link to (e.g. a Pitchfork review) is only requested
+      # and parsed once per run; the cache is dropped with the session
+      _page_caches: "weakref.WeakKeyDictionary[requests.Session, Dict]" = (
+          weakref.WeakKeyDictionary()
+      )
+      _page_cache_lock = threading.Lock()
+
+      def __init__(self, session: Optional[requests.Session] = None):
+          self.session = session or self.create_session()
+          with self._page_cache_lock:
+              self._page_cache: Dict[
+                  Tuple[str, Optional[SoupStrainer]], BeautifulSoup
+              ] = self._page_caches.setdefault(self.session, {})
+          self.logger = logging.getLogger(self.__class__.__name__)
+          # Stamped once per scraper instance: every release it produces,
+          # across repeated scrape() calls, shares this time
+          self._scraped_date = datetime.now().isoformat()
+
+      @staticmethod
+      def create_session() -> requests.Session:
+          session = requests.Session()
+          adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+          session.mount("https://", adapter)
+          session.mount("http://", adapter)
+          session.headers.update({
               "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0",
               "Accept": "text/html,application/xhtml+xml",
               "Accept-Language": "en-US,en;q=0.9",
           })
-          self.logger = logging.getLogger(self.__class__.__name__)
-          self._last_request_time = 0
+          return session
 
       @abstractmethod
       def scrape(self) -> List[ScrapedRelease]:
@@ -39,23 +72,112 @@ class BaseScraper(ABC):
       def _get_rate_limit(self) -> float:
           return RATE_LIMITS.get(self.RATE_LIMIT_KEY, RATE_LIMITS["default"])
 
+      def _get_rate_lock(self) -> threading.Lock:
+          with self._rate_locks_guard:
+              return self._rate_locks.setdefault(self.RATE_LIMIT_KEY, threading.Lock())
+
       def _rate_limit(self):
-          elapsed = time.time() - self._last_request_time
-          delay = self._get_rate_limit() + random.uniform(0.5, 2.0)
-          if elapsed < delay:
-              time.sleep(delay - elapsed)
-          self._last_request_time = time.time()
+          key = self.RATE_LIMIT_KEY
+          # Held while sleeping so concurrent fetches still start one delay apart
+          with self._get_rate_lock():
+              elapsed = time.time() - self._last_request_times.get(key, 0.0)
+              delay = self._get_rate_limit() + random.uniform(0.5, 2.0)
+              if elapsed < delay:
+                  time.sleep(delay - elapsed)
+              self._last_request_times[key] = time.time()
 
-      def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+      def _fetch_text(self, url: str) -> Optional[str]:
           self._rate_limit()
           try:
               self.logger.debug(f"Fetching: {url}")
               response = self.session.get(url, timeout=30)
               response.raise_for_status()
-              return BeautifulSoup(response.text, "lxml")
           except requests.RequestException as e:
               self.logger.error(f"Failed to fetch {url}: {e}")
               return None
+          return response.text
+
+      def _fetch_page(
+          self, url: str, strainer: Optional[SoupStrainer] = None
+      ) -> Optional[BeautifulSoup]:
+          key = (url, strainer)
+          with self._page_cache_lock:
+              cached = self._page_cache.get(key)
+          if cached is not None:
+              self.logger.debug(f"Cached: {url}")
+              return cached
+
+          html = self._fetch_text(url)
+          if html is None:
+              return None
+          soup = BeautifulSoup(html, "lxml", parse_only=strainer)
+
+          with self._page_cache_lock:
+              self._page_cache[key] = soup
+          return soup
+
+      def _fetch_many(
+          self, urls: List[str], max_workers: int = 4
+      ) -> List[Tuple[str, Optional[BeautifulSoup]]]:
+          # Request starts stay rate limited; only the waits for responses overlap
+          if len(urls) <= 1:
+              return [(url, self._fetch_page(url)) for url in urls]
+          with ThreadPoolExecutor(max_workers=max_workers) as executor:
+              return list(zip(urls, executor.map(self._fetch_page, urls)))
+
+      def _attach_review_genres(
+          self,
+          releases: List[ScrapedRelease],
+          review_path: str,
+          extract_genres: Callable[[BeautifulSoup], List[str]],
+      ) -> None:
+          # Only fetch releases that link to a review page, each URL once
+          review_urls = list(dict.fromkeys(
+              release.url for release in releases if review_path in release.url
+          ))
+          genres_by_url = {
+              url: extract_genres(soup)
+              for url, soup in self._fetch_many(review_urls)
+              if soup
+          }
+          for release in releases:
+              release.genres = genres_by_url.get(release.url, [])
+
+      @staticmethod
+      def _tag_matcher(
+          class_parts: Iterable[str] = (), names: Iterable[str] = ()
+      ) -> Callable[[Tag], bool]:
+          # Plain-Python equivalent of "[class*='part'], name" selector lists
+          class_parts = tuple(class_parts)
+          names = frozenset(names)
+
+          def match(tag: Tag) -> bool:
+              if tag.name in names:
+                  return True
+              classes = tag.get("class")
+              if not classes:
+                  return False
+              joined = " ".join(classes)
+              return any(part in joined for part in class_parts)
+
+          return match
+
+      @staticmethod
+      def _first_matches(item, **roles: Callable[[Tag], bool]) -> Dict[str, Optional[Tag]]:
+          # One walk over the subtree finds the first tag for every role,
+          # instead of a separate select_one traversal per role
+          found: Dict[str, Optional[Tag]] = dict.fromkeys(roles)
+          pending = dict(roles)
+          for tag in item.descendants:
+              if not isinstance(tag, Tag):
+                  continue
+              for role, match in list(pending.items()):
+                  if match(tag):
+                      found[role] = tag
+                      del pending[role]
+              if not pending:
+                  break
+          return found
 
       def _normalize_genres(self, genres: List[str]) -> List[str]:
           normalized = []
@@ -63,7 +185,8 @@ class BaseScraper(ABC):
               g = genre.lower().strip()
               if g and len(g) < 30:
                   normalized.append(g)
-          return list(set(normalized))
+          # Ordered dedupe keeps genre order stable between runs
+          return list(dict.fromkeys(normalized))
 
       def _validate_results(self, results: List[ScrapedRelease]) -> bool:
           if not results:
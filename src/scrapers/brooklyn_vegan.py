@@ -1,14 +1,49 @@
 """Scraper for Brooklyn Vegan Notable Releases."""
 
 import re
-from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..models import ScrapedRelease
 from .base import BaseScraper
 
+# Article pages only need their post body; skip building the nav/sidebar tree
+_ARTICLE_STRAINER = SoupStrainer(["article", "main"])
+
+_CONTENT_SELECTOR = (
+    "article .entry-content, .post-content, article .content, main article"
+)
+
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_SPOTIFY_RE = re.compile(r"spotify\.com/(album|track)/([a-zA-Z0-9]+)")
+_BANDCAMP_ALBUM_RE = re.compile(r"https?://([^.]+)\.bandcamp\.com/album/([^/?]+)")
+
+# Tried in order: earlier separators win even when a later one comes first in the text
+_SEPARATORS = (" - ", " – ", " — ", ": ", " / ")
+
+# Straight and curly quotes around album titles
+_QUOTE_CHARS = "\"'\u201c\u201d\u2018\u2019"
+
+# Common genre keywords, matched as substrings of the description text
+_GENRE_KEYWORDS = (
+    "punk", "hardcore", "post-punk", "emo",
+    "rock", "indie", "alternative", "garage",
+    "metal", "doom", "black metal", "death metal",
+    "electronic", "synth", "ambient",
+    "pop", "dream pop", "shoegaze",
+    "r&b", "soul", "hip-hop", "rap",
+    "folk", "country", "jazz",
+)
+
+
+def _is_album_link(link) -> bool:
+    # Same as "p > strong > a, p > b > a, h2 > a, h3 > a"
+    parent = link.parent
+    if parent.name in ("h2", "h3"):
+        return True
+    return parent.name in ("strong", "b") and parent.parent.name == "p"
+
 
 class BrooklynVeganScraper(BaseScraper):
     """Scraper for Brooklyn Vegan Notable Releases of the Week."""
@@ -29,20 +64,33 @@ class BrooklynVeganScraper(BaseScraper):
         # Find the most recent Notable Releases article
         notable_url = self._find_notable_releases_article(soup)
         if notable_url:
-            article_soup = self._fetch_page(notable_url)
+            article_soup = self._fetch_article(notable_url)
             if article_soup:
                 releases.extend(self._parse_notable_releases_article(article_soup, notable_url))
 
         # Also try the Indie Basement column
         indie_url = self._find_indie_basement_article(soup)
         if indie_url:
-            indie_soup = self._fetch_page(indie_url)
+            indie_soup = self._fetch_article(indie_url)
             if indie_soup:
                 releases.extend(self._parse_notable_releases_article(indie_soup, indie_url))
 
         self._validate_results(releases)
         return self._dedupe_releases(releases)
 
+    def _fetch_article(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch an article page, parsing only its post body when possible."""
+        html = self._fetch_text(url)
+        if html is None:
+            return None
+        soup = BeautifulSoup(html, "lxml", parse_only=_ARTICLE_STRAINER)
+        if soup.select_one(_CONTENT_SELECTOR) is None:
+            # The post body sits outside article/main, or the parser has to
+            # fall back to the whole page; the strained tree has neither, so
+            # reparse the text already downloaded
+            soup = BeautifulSoup(html, "lxml")
+        return soup
+
     def _find_notable_releases_article(self, soup: BeautifulSoup) -> Optional[str]:
         """Find the most recent Notable Releases article URL."""
         # Look for article links containing "notable-releases"
@@ -77,36 +125,36 @@ class BrooklynVeganScraper(BaseScraper):
 
     def _parse_notable_releases_article(
         self, soup: BeautifulSoup, article_url: str
-    ) -> List[ScrapedRelease]:
-        """Parse a Notable Releases article for album mentions."""
-        releases = []
+    ) -> Iterator[ScrapedRelease]:
+        """Yield the album mentions in a Notable Releases article."""
+        seen = set()
 
         # Get the article content
-        content = soup.select_one(
-            "article .entry-content, .post-content, article .content, main article"
-        )
+        content = soup.select_one(_CONTENT_SELECTOR)
         if not content:
             content = soup.select_one("article") or soup
 
         # Look for album entries - typically formatted as headers or bold text
         # Pattern 1: h2/h3/h4 headers with "Artist - Album" format
-        headers = content.select("h2, h3, h4, strong, b")
+        headers = content.find_all(["h2", "h3", "h4", "strong", "b"])
 
         for header in headers:
             text = header.get_text(strip=True)
             release = self._parse_release_text(text, article_url)
-            if release:
+            if release and release.key not in seen:
                 # Try to extract genres from surrounding text
                 next_elem = header.find_next_sibling()
                 if next_elem:
                     release.genres = self._extract_genres_from_text(
                         next_elem.get_text()
                     )
-                releases.append(release)
+                seen.add(release.key)
+                yield release
 
         # Pattern 2: Links with italic album titles
-        album_links = content.select("p > strong > a, p > b > a, h2 > a, h3 > a")
-        for link in album_links:
+        for link in content.find_all("a"):
+            if not _is_album_link(link):
+                continue
             href = link.get("href", "")
             text = link.get_text(strip=True)
 
@@ -114,16 +162,15 @@ class BrooklynVeganScraper(BaseScraper):
             parent_text = link.parent.get_text(strip=True) if link.parent else text
 
             release = self._parse_release_text(parent_text, href or article_url)
-            if release and release not in releases:
-                releases.append(release)
+            if release and release.key not in seen:
+                seen.add(release.key)
+                yield release
 
         # Pattern 3: Spotify/Bandcamp embeds
-        embed_releases = self._parse_embeds(content)
-        for release in embed_releases:
-            if release not in releases:
-                releases.append(release)
-
-        return releases
+        for release in self._parse_embeds(content):
+            if release.key not in seen:
+                seen.add(release.key)
+                yield release
 
     def _parse_release_text(self, text: str, url: str) -> Optional[ScrapedRelease]:
         """Parse artist/album from text like 'Artist - Album' or 'Artist: Album'."""
@@ -134,7 +181,7 @@ class BrooklynVeganScraper(BaseScraper):
         text = text.strip()
 
         # Try different separators
-        for sep in [" - ", " – ", " — ", ": ", " / "]:
+        for sep in _SEPARATORS:
             if sep in text:
                 parts = text.split(sep, 1)
                 if len(parts) == 2:
@@ -142,8 +189,8 @@ class BrooklynVeganScraper(BaseScraper):
                     album = parts[1].strip()
 
                     # Clean up common artifacts
-                    album = re.sub(r"\s*\([^)]*\)\s*$", "", album)  # Remove trailing (...)
-                    album = album.strip('"\'""''')
+                    album = _TRAILING_PAREN_RE.sub("", album)  # Remove trailing (...)
+                    album = album.strip(_QUOTE_CHARS)
 
                     if artist and album and len(artist) < 100 and len(album) < 100:
                         return ScrapedRelease(
@@ -152,15 +199,14 @@ class BrooklynVeganScraper(BaseScraper):
                             source=self.SOURCE_NAME,
                             release_type="album",
                             url=url,
-                            scraped_date=datetime.now().isoformat(),
+                            scraped_date=self._scraped_date,
                             genres=[],
                         )
 
         return None
 
-    def _parse_embeds(self, content) -> List[ScrapedRelease]:
-        """Extract releases from embedded players."""
-        releases = []
+    def _parse_embeds(self, content) -> Iterator[ScrapedRelease]:
+        """Yield releases from embedded players."""
 
         # Spotify embeds
         spotify_embeds = content.select(
@@ -169,7 +215,7 @@ class BrooklynVeganScraper(BaseScraper):
         for embed in spotify_embeds:
             src = embed.get("src", "") or embed.get("href", "")
             # Try to extract album/track info from Spotify URL
-            match = re.search(r"spotify\.com/(album|track)/([a-zA-Z0-9]+)", src)
+            match = _SPOTIFY_RE.search(src)
             if match:
                 # We'll get the actual details from Spotify later
                 # Just note that there's a Spotify reference here
@@ -181,53 +227,29 @@ class BrooklynVeganScraper(BaseScraper):
         )
         for embed in bandcamp_embeds:
             src = embed.get("src", "") or embed.get("href", "")
-            match = re.search(r"https?://([^.]+)\.bandcamp\.com/album/([^/?]+)", src)
+            match = _BANDCAMP_ALBUM_RE.search(src)
             if match:
                 artist = match.group(1).replace("-", " ").title()
                 album = match.group(2).replace("-", " ").title()
-                releases.append(
-                    ScrapedRelease(
-                        artist=artist,
-                        title=album,
-                        source=self.SOURCE_NAME,
-                        release_type="album",
-                        url=src,
-                        scraped_date=datetime.now().isoformat(),
-                        genres=[],
-                    )
+                yield ScrapedRelease(
+                    artist=artist,
+                    title=album,
+                    source=self.SOURCE_NAME,
+                    release_type="album",
+                    url=src,
+                    scraped_date=self._scraped_date,
+                    genres=[],
                 )
 
-        return releases
-
     def _extract_genres_from_text(self, text: str) -> List[str]:
         """Extract genre mentions from descriptive text."""
-        genres = []
         text_lower = text.lower()
-
-        # Common genre keywords
-        genre_keywords = [
-            "punk", "hardcore", "post-punk", "emo",
-            "rock", "indie", "alternative", "garage",
-            "metal", "doom", "black metal", "death metal",
-            "electronic", "synth", "ambient",
-            "pop", "dream pop", "shoegaze",
-            "r&b", "soul", "hip-hop", "rap",
-            "folk", "country", "jazz",
-        ]
-
-        for keyword in genre_keywords:
-            if keyword in text_lower:
-                genres.append(keyword)
-
+        genres = [keyword for keyword in _GENRE_KEYWORDS if keyword in text_lower]
         return self._normalize_genres(genres)
 
     def _dedupe_releases(self, releases: List[ScrapedRelease]) -> List[ScrapedRelease]:
-        """Remove duplicate releases."""
-        seen = set()
-        unique = []
+        """Remove duplicate releases, keeping the first of each."""
+        unique = {}
         for release in releases:
-            key = (release.artist.lower(), release.title.lower())
-            if key not in seen:
-                seen.add(key)
-                unique.append(release)
-        return unique
+            unique.setdefault(release.key, release)
+        return list(unique.values())
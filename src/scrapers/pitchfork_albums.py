@@ -1,14 +1,35 @@
 """Scraper for Pitchfork Best New Albums."""
 
 import re
-from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
 from ..models import ScrapedRelease
 from .base import BaseScraper
 
+_ALBUM_SLUG_RE = re.compile(r"/reviews/albums/([^/]+)/")
+
+_match_artist_tag = BaseScraper._tag_matcher(("artist", "Artist"), ("h3",))
+_match_album_tag = BaseScraper._tag_matcher(("album", "Album"), ("h4",))
+
+
+def _in_info(tag) -> bool:
+    return any("info" in (parent.get("class") or ()) for parent in tag.parents)
+
+
+# Same precedence as "[class*='artist'], [class*='Artist'], h3, .info h1" etc.
+def _match_artist(tag) -> bool:
+    return _match_artist_tag(tag) or (tag.name == "h1" and _in_info(tag))
+
+
+def _match_album(tag) -> bool:
+    return _match_album_tag(tag) or (tag.name == "h2" and _in_info(tag))
+
+
+def _match_review_link(tag) -> bool:
+    return tag.name == "a" and "/reviews/albums/" in tag.get("href", "")
+
 
 class PitchforkAlbumsScraper(BaseScraper):
     """Scraper for Pitchfork Best New Albums section."""
@@ -26,18 +47,27 @@ class PitchforkAlbumsScraper(BaseScraper):
             return releases
 
         # Try multiple selector patterns as Pitchfork's structure may vary
-        album_items = self._find_album_items(soup)
+        album_items, is_fallback = self._find_album_items(soup)
 
+        needs_genres = []
         for item in album_items[:20]:  # Limit to recent
-            release = self._parse_album_item(item)
+            release, from_markup = self._parse_album_item(item)
             if release:
                 releases.append(release)
+                # A bare fallback link named only by its URL slug isn't worth
+                # a review page fetch per item
+                if from_markup or not is_fallback:
+                    needs_genres.append(release)
+
+        self._attach_review_genres(
+            needs_genres, "/reviews/albums/", self._extract_review_genres
+        )
 
         self._validate_results(releases)
         return releases
 
-    def _find_album_items(self, soup: BeautifulSoup) -> List:
-        """Find album items using various selector patterns."""
+    def _find_album_items(self, soup: BeautifulSoup) -> Tuple[List, bool]:
+        """Find album items, and whether only the bare-link fallback matched."""
         # Try different possible structures
         selectors = [
             "div[class*='review-collection'] > div",
@@ -51,43 +81,43 @@ class PitchforkAlbumsScraper(BaseScraper):
             items = soup.select(selector)
             if items:
                 self.logger.debug(f"Found {len(items)} items with selector: {selector}")
-                return items
+                return items, False
 
         # Fallback: look for any links to album reviews
-        return soup.select("a[href*='/reviews/albums/']")
+        return soup.select("a[href*='/reviews/albums/']"), True
 
-    def _parse_album_item(self, item) -> Optional[ScrapedRelease]:
-        """Parse an album item from the listing."""
+    def _parse_album_item(self, item) -> Tuple[Optional[ScrapedRelease], bool]:
+        """Parse an album item, and whether any field came from markup, not the slug."""
+        from_markup = False
         try:
             # Try to extract artist and album
             artist = None
             album = None
             review_url = None
-            genres = []
 
             # Method 1: Structured data
-            artist_elem = item.select_one(
-                "[class*='artist'], [class*='Artist'], h3, .info h1"
-            )
-            album_elem = item.select_one(
-                "[class*='album'], [class*='Album'], h4, .info h2"
+            found = self._first_matches(
+                item, artist=_match_artist, album=_match_album, link=_match_review_link
             )
+            artist_elem = found["artist"]
+            album_elem = found["album"]
 
             if artist_elem:
                 artist = artist_elem.get_text(strip=True)
             if album_elem:
                 album = album_elem.get_text(strip=True)
+            from_markup = bool(artist_elem or album_elem)
 
             # Method 2: Link with combined text
             if not artist or not album:
-                link = item if item.name == "a" else item.select_one("a[href*='/reviews/albums/']")
+                link = item if item.name == "a" else found["link"]
                 if link:
                     review_url = link.get("href", "")
                     if not review_url.startswith("http"):
                         review_url = f"https://pitchfork.com{review_url}"
 
                     # Try to parse from URL: /reviews/albums/artist-name-album-name/
-                    url_match = re.search(r"/reviews/albums/([^/]+)/", review_url)
+                    url_match = _ALBUM_SLUG_RE.search(review_url)
                     if url_match and not (artist and album):
                         slug = url_match.group(1)
                         # Try to split artist-album from slug
@@ -103,8 +133,10 @@ class PitchforkAlbumsScraper(BaseScraper):
                         parts = link_text.split(" - ", 1)
                         artist = parts[0].strip()
                         album = parts[1].strip()
+                        from_markup = True
                     elif link_text and not artist:
                         artist = link_text
+                        from_markup = True
 
             # Method 3: Separate spans/divs
             if not artist:
@@ -114,15 +146,12 @@ class PitchforkAlbumsScraper(BaseScraper):
                         text = elem.get_text(strip=True)
                         if text and len(text) < 100:
                             artist = text
+                            from_markup = True
                             break
 
-            # Get genres from review page if we have URL
             if review_url and not review_url.startswith("http"):
                 review_url = f"https://pitchfork.com{review_url}"
 
-            if review_url:
-                genres = self._get_genres_from_review(review_url)
-
             if artist and album:
                 return ScrapedRelease(
                     artist=artist,
@@ -130,27 +159,19 @@ class PitchforkAlbumsScraper(BaseScraper):
                     source=self.SOURCE_NAME,
                     release_type="album",
                     url=review_url or self.BASE_URL,
-                    scraped_date=datetime.now().isoformat(),
-                    genres=genres,
-                )
+                    scraped_date=self._scraped_date,
+                    genres=[],
+                ), from_markup
 
         except Exception as e:
             self.logger.debug(f"Failed to parse album item: {e}")
 
-        return None
+        return None, from_markup
 
-    def _get_genres_from_review(self, url: str) -> List[str]:
+    def _extract_review_genres(self, soup: BeautifulSoup) -> List[str]:
         """Extract genres from an album review page."""
         genres = []
 
-        # Only fetch if we have a valid review URL
-        if "/reviews/albums/" not in url:
-            return genres
-
-        soup = self._fetch_page(url)
-        if not soup:
-            return genres
-
         # Look for genre labels
         genre_elems = soup.select(
             "[class*='genre'], [class*='Genre'], .tag, a[href*='/genre/']"
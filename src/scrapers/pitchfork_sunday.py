@@ -1,14 +1,25 @@
 """Scraper for Pitchfork Sunday Review (classic/older albums)."""
 
 import re
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from bs4 import BeautifulSoup
 
 from ..models import ScrapedRelease
 from .base import BaseScraper
 
+_ALBUM_SLUG_RE = re.compile(r"/reviews/albums/([^/]+)/")
+
+# The "Sunday Review" label, then retrospective indicators
+_SUNDAY_MARKERS = ("sunday review", "retrospective", "reissue", "classic")
+
+_match_artist = BaseScraper._tag_matcher(("artist", "Artist"), ("h3",))
+_match_album = BaseScraper._tag_matcher(("album", "Album"), ("h4", "em", "i"))
+
+
+def _match_review_link(tag) -> bool:
+    return tag.name == "a" and "/reviews/albums/" in tag.get("href", "")
+
 
 class PitchforkSundayScraper(BaseScraper):
     """Scraper for Pitchfork Sunday Review - retrospective classic albums."""
@@ -29,8 +40,23 @@ class PitchforkSundayScraper(BaseScraper):
         # Find Sunday Review articles
         sunday_articles = self._find_sunday_reviews(soup)
 
-        for article in sunday_articles[:5]:  # Limit to recent
-            release = self._parse_review_article(article)
+        articles = sunday_articles[:5]  # Limit to recent
+
+        # Resolve each review URL once; a malformed article is skipped
+        # rather than aborting the scrape
+        linked = []
+        for article in articles:
+            try:
+                linked.append((article, self._review_url(article)))
+            except Exception as e:
+                self.logger.debug(f"Failed to parse Sunday Review article: {e}")
+
+        # Fetch every review page up front so the waits overlap
+        review_urls = [url for _, url in linked if url]
+        review_pages = dict(self._fetch_many(list(dict.fromkeys(review_urls))))
+
+        for article, review_url in linked:
+            release = self._parse_review_article(article, review_url, review_pages)
             if release:
                 releases.append(release)
 
@@ -46,14 +72,7 @@ class PitchforkSundayScraper(BaseScraper):
 
         for article in all_articles:
             article_text = article.get_text().lower()
-            # Check if it's labeled as Sunday Review
-            if "sunday review" in article_text:
-                articles.append(article)
-            # Also check for retrospective indicators
-            elif any(
-                indicator in article_text
-                for indicator in ["retrospective", "reissue", "classic"]
-            ):
+            if any(marker in article_text for marker in _SUNDAY_MARKERS):
                 articles.append(article)
 
         # If no labeled articles found, try searching the page differently
@@ -67,28 +86,32 @@ class PitchforkSundayScraper(BaseScraper):
 
         return articles
 
-    def _parse_review_article(self, article) -> Optional[ScrapedRelease]:
+    def _review_url(self, article) -> Optional[str]:
+        """Get the full review URL linked from an article, if any."""
+        link = article if article.name == "a" else article.find(_match_review_link)
+        if not link:
+            return None
+        review_url = link.get("href", "")
+        if not review_url.startswith("http"):
+            review_url = f"https://pitchfork.com{review_url}"
+        return review_url
+
+    def _parse_review_article(
+        self,
+        article,
+        review_url: Optional[str],
+        review_pages: Dict[str, Optional[BeautifulSoup]],
+    ) -> Optional[ScrapedRelease]:
         """Parse a Sunday Review article for album info."""
         try:
             artist = None
             album = None
-            review_url = None
             genres = []
 
-            # Get the review URL
-            link = article if article.name == "a" else article.select_one("a[href*='/reviews/albums/']")
-            if link:
-                review_url = link.get("href", "")
-                if not review_url.startswith("http"):
-                    review_url = f"https://pitchfork.com{review_url}"
-
             # Try to get artist/album from article structure
-            artist_elem = article.select_one(
-                "[class*='artist'], [class*='Artist'], h3"
-            )
-            album_elem = article.select_one(
-                "[class*='album'], [class*='Album'], h4, em, i"
-            )
+            found = self._first_matches(article, artist=_match_artist, album=_match_album)
+            artist_elem = found["artist"]
+            album_elem = found["album"]
 
             if artist_elem:
                 artist = artist_elem.get_text(strip=True)
@@ -97,7 +120,7 @@ class PitchforkSundayScraper(BaseScraper):
 
             # Try to parse from URL if needed
             if review_url and (not artist or not album):
-                url_match = re.search(r"/reviews/albums/([^/]+)/", review_url)
+                url_match = _ALBUM_SLUG_RE.search(review_url)
                 if url_match:
                     slug = url_match.group(1)
                     # Slug format is usually: artist-name-album-name
@@ -109,7 +132,7 @@ class PitchforkSundayScraper(BaseScraper):
 
             # Get full details from review page
             if review_url:
-                page_data = self._parse_full_review_page(review_url)
+                page_data = self._parse_full_review_page(review_pages.get(review_url))
                 if page_data:
                     artist = page_data.get("artist") or artist
                     album = page_data.get("album") or album
@@ -122,7 +145,7 @@ class PitchforkSundayScraper(BaseScraper):
                     source=self.SOURCE_NAME,
                     release_type="album",
                     url=review_url or self.BASE_URL,
-                    scraped_date=datetime.now().isoformat(),
+                    scraped_date=self._scraped_date,
                     genres=genres,
                 )
 
@@ -131,9 +154,8 @@ class PitchforkSundayScraper(BaseScraper):
 
         return None
 
-    def _parse_full_review_page(self, url: str) -> Optional[dict]:
+    def _parse_full_review_page(self, soup: Optional[BeautifulSoup]) -> Optional[dict]:
         """Parse full album review page for detailed info."""
-        soup = self._fetch_page(url)
         if not soup:
             return None
 
@@ -1,7 +1,6 @@
 """Scraper for Pitchfork Best New Tracks."""
 
 import re
-from datetime import datetime
 from typing import List, Optional
 
 from bs4 import BeautifulSoup
@@ -9,6 +8,16 @@ from bs4 import BeautifulSoup
 from ..models import ScrapedRelease
 from .base import BaseScraper
 
+# Straight and curly quotes around track titles
+_QUOTE_CHARS = "\"'\u201c\u201d\u2018\u2019"
+
+_match_artist = BaseScraper._tag_matcher(("artist", "Artist"), ("h3",))
+_match_title = BaseScraper._tag_matcher(("title", "Title", "track"), ("h4",))
+
+
+def _match_review_link(tag) -> bool:
+    return tag.name == "a" and "/reviews/tracks/" in tag.get("href", "")
+
 
 class PitchforkTracksScraper(BaseScraper):
     """Scraper for Pitchfork Best New Tracks section."""
@@ -33,6 +42,10 @@ class PitchforkTracksScraper(BaseScraper):
             if release:
                 releases.append(release)
 
+        self._attach_review_genres(
+            releases, "/reviews/tracks/", self._extract_review_genres
+        )
+
         self._validate_results(releases)
         return releases
 
@@ -61,26 +74,24 @@ class PitchforkTracksScraper(BaseScraper):
             artist = None
             track = None
             review_url = None
-            genres = []
 
             # Try to extract artist and track title
-            artist_elem = item.select_one(
-                "[class*='artist'], [class*='Artist'], h3"
-            )
-            track_elem = item.select_one(
-                "[class*='title'], [class*='Title'], [class*='track'], h4"
+            found = self._first_matches(
+                item, artist=_match_artist, track=_match_title, link=_match_review_link
             )
+            artist_elem = found["artist"]
+            track_elem = found["track"]
 
             if artist_elem:
                 artist = artist_elem.get_text(strip=True)
             if track_elem:
                 track = track_elem.get_text(strip=True)
                 # Remove quotes if present
-                track = track.strip('"\'""''')
+                track = track.strip(_QUOTE_CHARS)
 
             # Try link parsing
             if not artist or not track:
-                link = item if item.name == "a" else item.select_one("a[href*='/reviews/tracks/']")
+                link = item if item.name == "a" else found["link"]
                 if link:
                     review_url = link.get("href", "")
                     if not review_url.startswith("http"):
@@ -93,15 +104,12 @@ class PitchforkTracksScraper(BaseScraper):
                         if sep in link_text:
                             parts = link_text.split(sep, 1)
                             artist = artist or parts[0].strip()
-                            track = track or parts[1].strip().strip('"\'""''')
+                            track = track or parts[1].strip()
                             break
 
             # Clean up track name
             if track:
-                track = track.strip('"\'""''')
-
-            if review_url:
-                genres = self._get_genres_from_review(review_url)
+                track = track.strip(_QUOTE_CHARS)
 
             if artist and track:
                 return ScrapedRelease(
@@ -110,8 +118,8 @@ class PitchforkTracksScraper(BaseScraper):
                     source=self.SOURCE_NAME,
                     release_type="track",
                     url=review_url or self.BASE_URL,
-                    scraped_date=datetime.now().isoformat(),
-                    genres=genres,
+                    scraped_date=self._scraped_date,
+                    genres=[],
                 )
 
         except Exception as e:
@@ -119,17 +127,10 @@ class PitchforkTracksScraper(BaseScraper):
 
         return None
 
-    def _get_genres_from_review(self, url: str) -> List[str]:
+    def _extract_review_genres(self, soup: BeautifulSoup) -> List[str]:
         """Extract genres from a track review page."""
         genres = []
 
-        if "/reviews/tracks/" not in url:
-            return genres
-
-        soup = self._fetch_page(url)
-        if not soup:
-            return genres
-
         genre_elems = soup.select(
             "[class*='genre'], [class*='Genre'], .tag, a[href*='/genre/']"
         )
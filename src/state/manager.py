@@ -1,35 +1,59 @@
 """State management for playlist history and retention."""
 
-import json
 import logging
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Optional
+
+import orjson
 
 from ..config import RETENTION_WEEKS
 from ..models import PlaylistItem
 
 logger = logging.getLogger(__name__)
 
+# Manual search placeholders are kept out of the retention history
+SEARCH_PREFIX = "spotify:search:"
+
+# RETENTION_WEEKS is fixed at import, so the window is built once
+RETENTION_WINDOW = timedelta(weeks=RETENTION_WEEKS)
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(date_str: str) -> datetime:
+    # Every track added in one run shares that run's timestamp, so even a
+    # large history only holds a handful of distinct strings
+    return datetime.fromisoformat(date_str)
+
 
 class StateManager:
     """Manage playlist state with 2-week retention policy."""
 
     def __init__(self, state_file: Path):
         self.state_file = state_file
-        self.state = self._load_state()
+        self._state: Optional[Dict] = None
+        self._dirty = False
+        self._history_uris: Optional[FrozenSet[str]] = None
+
+    @property
+    def state(self) -> Dict:
+        """State dict, read from disk the first time it is needed."""
+        if self._state is None:
+            self._state = self._load_state()
+        return self._state
 
     def _load_state(self) -> Dict:
         """Load state from JSON file."""
         if self.state_file.exists():
             try:
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    state = json.load(f)
-                    logger.info(
-                        f"Loaded state with {len(state.get('track_history', {}))} tracks"
-                    )
-                    return state
-            except (json.JSONDecodeError, IOError) as e:
+                state = orjson.loads(self.state_file.read_bytes())
+                logger.info(
+                    f"Loaded state with {len(state.get('track_history', {}))} tracks"
+                )
+                return state
+            except (orjson.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load state file: {e}")
 
         return {
@@ -39,13 +63,28 @@ class StateManager:
 
     def save_state(self):
         """Persist state to JSON file."""
+        if not self._dirty:
+            logger.info("State unchanged, not saving")
+            return
+
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write a sibling file and swap it in, so a crash mid-write never
+        # leaves a truncated state file behind
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
         try:
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(self.state, f, indent=2, ensure_ascii=False)
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(self.state, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+            self._dirty = False
             logger.info(f"State saved to {self.state_file}")
         except IOError as e:
             logger.error(f"Failed to save state: {e}")
+        finally:
+            # Gone after a successful swap; otherwise don't leave a partial
+            # file in data/ for the workflow to commit
+            tmp_file.unlink(missing_ok=True)
 
     def apply_retention(self, items: List[PlaylistItem]) -> List[PlaylistItem]:
         """
@@ -55,59 +94,53 @@ class StateManager:
         - Update track ages
         - Return items that should be in current playlist
         """
-        cutoff_date = datetime.now() - timedelta(weeks=RETENTION_WEEKS)
+        now = datetime.now()
+        now_str = now.isoformat()
+        cutoff_date = now - RETENTION_WINDOW
         history = self.state["track_history"]
 
-        # Clean up expired entries
-        expired_uris = []
-        for uri, date_str in history.items():
+        # Clean up expired entries. Tracks added in the same run share a
+        # timestamp, so expiry is decided once per distinct string
+        expired_dates = set()
+        for date_str in set(history.values()):
             try:
-                added_date = datetime.fromisoformat(date_str)
-                if added_date < cutoff_date:
-                    expired_uris.append(uri)
+                if _parse_iso(date_str) < cutoff_date:
+                    expired_dates.add(date_str)
             except ValueError:
-                expired_uris.append(uri)
-
-        for uri in expired_uris:
-            del history[uri]
-            logger.debug(f"Expired track removed: {uri}")
-
-        if expired_uris:
-            logger.info(f"Removed {len(expired_uris)} expired tracks from history")
+                expired_dates.add(date_str)
+        if expired_dates:
+            kept = {
+                uri: date_str
+                for uri, date_str in history.items()
+                if date_str not in expired_dates
+            }
+            removed = len(history) - len(kept)
+            self.state["track_history"] = history = kept
+            logger.info(f"Removed {removed} expired tracks from history")
 
         # Process items
         current_items = []
-        now = datetime.now()
-        now_str = now.isoformat()
+        append = current_items.append
+        add_to_history = history.setdefault
 
         for item in items:
             uri = item.spotify_uri
 
             # Skip search URIs (these are manual search placeholders)
-            if uri.startswith("spotify:search:"):
-                current_items.append(item)
+            if uri.startswith(SEARCH_PREFIX):
+                append(item)
                 continue
 
-            # Add new tracks to history
-            if uri not in history:
-                history[uri] = now_str
-
-            # Check if within retention window
-            try:
-                added_date = datetime.fromisoformat(history[uri])
-                if added_date >= cutoff_date:
-                    # Calculate weeks in playlist
-                    item.weeks_in_playlist = (now - added_date).days // 7
-                    current_items.append(item)
-                else:
-                    logger.debug(f"Skipping expired track: {item.artist} - {item.track}")
-            except ValueError:
-                # Invalid date, treat as new
-                history[uri] = now_str
-                item.weeks_in_playlist = 0
-                current_items.append(item)
+            # Add new tracks to history. The sweep above already dropped
+            # every expired or unparseable entry, so whatever remains is
+            # inside the retention window
+            added_date = _parse_iso(add_to_history(uri, now_str))
+            item.weeks_in_playlist = (now - added_date).days // 7
+            append(item)
 
         self.state["last_run"] = now_str
+        self._dirty = True
+        self._history_uris = None
 
         logger.info(
             f"Retention applied: {len(items)} items -> {len(current_items)} current"
@@ -115,9 +148,12 @@ class StateManager:
 
         return current_items
 
-    def get_track_history(self) -> Set[str]:
+    def get_track_history(self) -> FrozenSet[str]:
         """Get set of URIs currently in rotation."""
-        return set(self.state["track_history"].keys())
+        # Only apply_retention changes the history, and it clears this
+        if self._history_uris is None:
+            self._history_uris = frozenset(self.state["track_history"])
+        return self._history_uris
 
     def get_last_run(self) -> datetime | None:
         """Get the datetime of the last run."""
@@ -0,0 +1,103 @@
+"""Tests for GenreFilter against the original nested-loop matching."""
+
+import itertools
+import random
+
+import pytest
+
+from src.config import EXCLUDE_GENRES, INCLUDE_GENRES
+from src.filters import genre_filter
+from src.filters.genre_filter import GenreFilter
+from src.models import ScrapedRelease
+
+VOCAB = INCLUDE_GENRES + EXCLUDE_GENRES + [
+    "", "e", "art", "ska", "rap", "jazz", "folk", "bass", "room", "noise",
+    "indie", "country", "hip-hop", "progressive", "edm-ish", "prog rock band",
+    "Post-Punk", "Prog Metal", "EDM",
+]
+
+
+def reference_should_include(genres, include, exclude):
+    """The original exclude-first, substring-in-either-direction loops."""
+    include = [g.lower() for g in include]
+    exclude = [g.lower() for g in exclude]
+    release_genres = [g.lower() for g in genres]
+
+    for genre in release_genres:
+        for excluded in exclude:
+            if excluded in genre or genre in excluded:
+                return False
+
+    if not release_genres:
+        return True
+
+    for genre in release_genres:
+        for included in include:
+            if included in genre or genre in included:
+                return True
+
+    if len(release_genres) >= 3:
+        return False
+
+    return True
+
+
+def make_release(genres):
+    return ScrapedRelease(
+        artist="Artist",
+        title="Title",
+        source="test",
+        release_type="album",
+        url="https://example.com",
+        scraped_date="2024-01-01T00:00:00",
+        genres=list(genres),
+    )
+
+
+def make_filter(monkeypatch, include, exclude):
+    # Empty lists fall back to the config defaults, so patch those instead
+    monkeypatch.setattr(genre_filter, "INCLUDE_GENRES", include)
+    monkeypatch.setattr(genre_filter, "EXCLUDE_GENRES", exclude)
+    return GenreFilter()
+
+
+def genre_samples(seed=1, count=2000):
+    rng = random.Random(seed)
+    samples = [[], [""]] + [[g] for g in VOCAB]
+    samples += [list(pair) for pair in itertools.combinations(VOCAB[:12], 2)]
+    samples += [rng.sample(VOCAB, rng.randint(0, 4)) for _ in range(count)]
+    return samples
+
+
+@pytest.mark.parametrize(
+    "include, exclude",
+    [
+        (INCLUDE_GENRES, EXCLUDE_GENRES),
+        (INCLUDE_GENRES, []),
+        ([], EXCLUDE_GENRES),
+        ([], []),
+        (["rock"], ["prog rock"]),
+    ],
+    ids=["defaults", "no-exclude", "no-include", "no-terms", "overlap"],
+)
+def test_should_include_matches_reference(monkeypatch, include, exclude):
+    genre_filter_ = make_filter(monkeypatch, include, exclude)
+
+    for genres in genre_samples():
+        expected = reference_should_include(genres, include, exclude)
+        assert genre_filter_._should_include(make_release(genres)) == expected, genres
+
+
+def test_empty_exclude_keeps_tagged_releases(monkeypatch):
+    genre_filter_ = make_filter(monkeypatch, INCLUDE_GENRES, [])
+
+    assert genre_filter_._should_include(make_release(["punk"]))
+    assert genre_filter_._should_include(make_release(["prog metal"]))
+
+
+def test_empty_include_rejects_only_heavily_tagged(monkeypatch):
+    genre_filter_ = make_filter(monkeypatch, [], EXCLUDE_GENRES)
+
+    assert genre_filter_._should_include(make_release(["punk"]))
+    assert not genre_filter_._should_include(make_release(["punk", "emo", "soul"]))
+